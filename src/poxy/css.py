@@ -59,7 +59,7 @@ def resolve_imports(text, cwd=None, use_cached_fonts=True) -> Tuple[str, bool]:
         import_path = strip_quotes(m[1].strip())
         had_mcss_files = had_mcss_files or has_mcss_filename(import_path)
         path = None
-        path_ok = lambda: path is not None and path.exists() and path.is_file()
+        path_ok = lambda: path is not None and path.is_file()
 
         # download + cache uris locally
         if is_uri(import_path):
@@ -24,41 +24,47 @@ from .utils import *
 # =======================================================================================================================
 
 
+_MANGLE_NAME_TABLE = str.maketrans(
+    {
+        '_': '__',
+        ':': '_1',
+        '/': '_2',
+        '<': '_3',
+        '>': '_4',
+        '*': '_5',
+        '&': '_6',
+        '|': '_7',
+        '.': '_8',
+        '!': '_9',
+        ',': '_00',
+        ' ': '_01',
+        '{': '_02',
+        '}': '_03',
+        '?': '_04',
+        '^': '_05',
+        '%': '_06',
+        '(': '_07',
+        ')': '_08',
+        '+': '_09',
+        '=': '_0a',
+        '$': '_0b',
+        '\\': '_0c',
+        '@': '_0d',
+        ']': '_0e',
+        '[': '_0f',
+        '#': '_0g',
+        **{c: '_' + c.lower() for c in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'},
+    }
+)
+
+
 def mangle_name(name):
     '''
     A lightweight version of doxygen's escapeCharsInString()
     (see https://github.com/doxygen/doxygen/blob/master/src/util.cpp)
     '''
     assert name is not None
-    name = name.replace('_', '__')
-    name = name.replace(':', '_1')
-    name = name.replace('/', '_2')
-    name = name.replace('<', '_3')
-    name = name.replace('>', '_4')
-    name = name.replace('*', '_5')
-    name = name.replace('&', '_6')
-    name = name.replace('|', '_7')
-    name = name.replace('.', '_8')
-    name = name.replace('!', '_9')
-    name = name.replace(',', '_00')
-    name = name.replace(' ', '_01')
-    name = name.replace('{', '_02')
-    name = name.replace('}', '_03')
-    name = name.replace('?', '_04')
-    name = name.replace('^', '_05')
-    name = name.replace('%', '_06')
-    name = name.replace('(', '_07')
-    name = name.replace(')', '_08')
-    name = name.replace('+', '_09')
-    name = name.replace('=', '_0a')
-    name = name.replace('$', '_0b')
-    name = name.replace('\\', '_0c')
-    name = name.replace('@', '_0d')
-    name = name.replace(']', '_0e')
-    name = name.replace('[', '_0f')
-    name = name.replace('#', '_0g')
-    name = re.sub(r'[A-Z]', lambda m: '_' + m[0].lower(), name)
-    return name
+    return name.translate(_MANGLE_NAME_TABLE)
 
 
 def format_for_doxyfile(val):
@@ -83,7 +89,7 @@ def path() -> Path:
             if not p:
                 return None
             p = Path(p)
-            if not p.exists() or not p.is_file() or not os.access(str(p), os.X_OK):
+            if not p.is_file() or not os.access(str(p), os.X_OK):
                 return None
             return p.resolve()
 
@@ -208,16 +214,10 @@ class Doxyfile(object):
         return self.__text.find(text) != -1
 
     def get_value(self, key, fallback=None):
-        pattern = re.compile(rf'\n\s*{key}\s*=(.*?)\n', flags=re.S)
-        text = self.__text
-        m = pattern.search(text)
-        while m:
-            # doxygen allows values to appear multiple times and only accepts the last one, hence the loop
-            text = text[m.end() :]
-            n = pattern.search(text)
-            if not n:
-                break
-            m = n
+        # doxygen allows values to appear multiple times and only accepts the last one
+        m = None
+        for m in re.finditer(rf'\n\s*{re.escape(key)}\s*=(.*?)\n', self.__text, flags=re.S):
+            pass
         if m:
             val = m[1].strip(' "')
             return val if val else fallback
@@ -45,18 +45,25 @@ class Emoji(object):
         self.codepoints.sort()
         self.codepoints = tuple(self.codepoints)
         self.uri = str(uri)
+        self.__html = r''.join([rf'&#x{cp:X};' for cp in self.codepoints]) + r'&#xFE0F;'
 
     def __str__(self) -> str:
-        s = ''
-        for cp in self.codepoints:
-            s += rf'&#x{cp:X};'
-        return rf'{s}&#xFE0F;'
+        return self.__html
 
 
 class Database(object):
+    __cache = dict()  # (path, mtime) => (by_key, by_codepoint)
+
     def __init__(self):
         path = Path(paths.GENERATED, r'emoji.json')
         assert_existing_file(path)
+
+        # the lookup tables are read-only once built so they can be shared between instances
+        cache_key = (str(path.resolve()), path.stat().st_mtime_ns)
+        if cache_key in Database.__cache:
+            self.__by_key, self.__by_codepoint = Database.__cache[cache_key]
+            return
+
         emoji = json.loads(read_all_text_from_file(path))
 
         # load by key
@@ -81,6 +88,8 @@ class Database(object):
             if key in self.__by_key and alias not in self.__by_key:
                 self.__by_key[alias] = self.__by_key[key]
 
+        Database.__cache[cache_key] = (self.__by_key, self.__by_codepoint)
+
     def __contains__(self, key: Union[int, str]) -> bool:
         assert key is not None
         if isinstance(key, int):
@@ -8,6 +8,8 @@
 """
 
 import html
+import os
+import stat
 
 from bs4 import NavigableString
 from trieregex import TrieRegEx
@@ -24,7 +26,9 @@ from .utils import *
 
 
 class HTMLFixer(object):
-    pass
+    # if set, the fixer has nothing to do on a page whose markup contains none of these strings
+    # (lets post-processing skip it without searching the document at all)
+    required_text = None
 
 
 class PlainTextFixer(object):
@@ -139,7 +143,7 @@ TAG_PARENTS = TrieRegEx(
 TAG_PARENTS = TAG_PARENTS.regex()
 TAG_PARENTS = re.compile(rf'^{TAG_PARENTS}$', re.I)
 
-TAG_DISALLOWED_PARENTS = (r'code', r'pre')
+TAG_DISALLOWED_PARENTS = frozenset((r'code', r'pre'))
 
 
 class CustomTags(HTMLFixer):
@@ -148,8 +152,9 @@ class CustomTags(HTMLFixer):
     '''
 
     __hex_entity = re.compile(r'(?:[0#]?[xX])?([a-fA-F0-9]+)')
+    __emoji_number = re.compile(r'[+-]?(?:\dx)?[\da-f_]+')  # superset of int(s, 16), incl. non-ascii digits
 
-    def __paired_tags_substitute(cls, m, out, context):
+    def __paired_tags_substitute(cls, m, context):
         tag_name = m[1].lower()
         tag_attrs = m[2].strip() if m[2] else ''
         tag_attrs = rf' {tag_attrs}' if tag_attrs else ''
@@ -179,13 +184,14 @@ class CustomTags(HTMLFixer):
                 return ''
             tag_attrs = tag_attrs.lower()
             emoji = None
-            for base in (16, 10):
-                try:
-                    emoji = context.emoji[int(tag_attrs, base)]
-                    if emoji is not None:
-                        break
-                except:
-                    pass
+            if cls.__emoji_number.fullmatch(tag_attrs):  # don't bother trying to parse names as numbers
+                for base in (16, 10):
+                    try:
+                        emoji = context.emoji[int(tag_attrs, base)]
+                        if emoji is not None:
+                            break
+                    except:
+                        pass
             if emoji is None:
                 emoji = context.emoji[tag_attrs]
             return str(emoji) if emoji is not None else ''
@@ -216,17 +222,28 @@ class CustomTags(HTMLFixer):
             return tags
 
         # paired tags
+        # (the pattern is unanchored, so if a tag's markup doesn't contain a match then none of its descendants' can
+        # either, and the whole subtree can be skipped; replaced subtrees are picked up again by the next pass)
         changed_this_pass = True
         while changed_this_pass:
             changed_this_pass = False
-            for tag in get_candidate_tags():
-                replacer = RegexReplacer(
-                    PAIRED_TAGS, lambda m, out: self.__paired_tags_substitute(m, out, context), str(tag)
-                )
-                if replacer:
+            stack = list(reversed(doc.article_content.contents))
+            while stack:
+                tag = stack.pop()
+                if isinstance(tag, NavigableString) or tag.name in TAG_DISALLOWED_PARENTS:
+                    continue
+                if not len(tag.contents):
+                    continue
+                if TAG_PARENTS.search(tag.name) is None:
+                    stack.extend(reversed(tag.contents))
+                    continue
+                tag_str = str(tag)
+                if '[' not in tag_str:
+                    continue
+                tag_str, count = PAIRED_TAGS.subn(lambda m: self.__paired_tags_substitute(m, context), tag_str)
+                if count:
                     changed_this_pass = True
-                    soup.replace_tag(tag, str(replacer))
-                    break
+                    soup.replace_tag(tag, tag_str)
             if changed_this_pass:
                 doc.smooth()
                 changed = True
@@ -240,18 +257,20 @@ class CustomTags(HTMLFixer):
             for tag in tags:
                 strings += [string for string in tag.children if isinstance(string, NavigableString) and len(string)]
             for string in strings:
-                before = str(string)
-                replacer = RegexReplacer(
-                    SINGLE_TAGS, lambda m, out: self.__single_tags_substitute(m, out, context), str(string)
+                string_str = str(string)
+                if '[' not in string_str:
+                    continue
+                custom_tags = []
+                string_str, count = SINGLE_TAGS.subn(
+                    lambda m: self.__single_tags_substitute(m, custom_tags, context), string_str
                 )
-                if replacer:
+                if count:
                     changed_this_pass = True
                     parent = string.parent
-                    new_tags = soup.replace_tag(string, str(replacer))
+                    new_tags = soup.replace_tag(string, string_str)
                     if parent is not None and parent.name == 'p' and not len(parent.contents):
                         parent = parent.parent
-                    for i in range(len(replacer)):  # custom tag handling
-                        key = replacer[i][0]
+                    for key, value in custom_tags:  # custom tag handling
                         if key.find(r'parent_') != -1:
                             if key.find(r'parent_parent') != -1:
                                 key = key.replace(r'parent_parent', r'parent')
@@ -260,15 +279,15 @@ class CustomTags(HTMLFixer):
                             if parent is None:
                                 continue
                             if key in (r'parent_add_class', r'add_parent_class'):
-                                soup.add_class(parent, replacer[i][1])
+                                soup.add_class(parent, value)
                             elif key in (r'parent_remove_class', r'remove_parent_class'):
-                                soup.remove_class(parent, replacer[i][1])
+                                soup.remove_class(parent, value)
                             elif key in (r'parent_set_class', r'set_parent_class'):
-                                soup.set_class(parent, replacer[i][1])
+                                soup.set_class(parent, value)
                             elif key in (r'parent_set_name', r'set_parent_name'):
-                                parent.name = replacer[i][1]
+                                parent.name = value
                             elif key in (r'parent_set_id', r'set_parent_id'):
-                                parent['id'] = replacer[i][1]
+                                parent['id'] = value
                         elif key.find(r'_class') or key.find(r'_name') != -1 or key.find(r'_id') != -1:
                             target = None
                             if len(new_tags) == 1:
@@ -280,15 +299,15 @@ class CustomTags(HTMLFixer):
                             if not target:
                                 continue
                             if key == r'add_class':
-                                soup.add_class(target, replacer[i][1])
+                                soup.add_class(target, value)
                             elif key == r'remove_class':
-                                soup.remove_class(target, replacer[i][1])
+                                soup.remove_class(target, value)
                             elif key == r'set_class':
-                                soup.set_class(target, replacer[i][1])
+                                soup.set_class(target, value)
                             elif key == r'set_name':
-                                target.name = replacer[i][1]
+                                target.name = value
                             elif key == r'set_id':
-                                target.id = replacer[i][1]
+                                target.id = value
                     continue
             if changed_this_pass:
                 doc.smooth()
@@ -315,6 +334,22 @@ class _CPPModifiersBase(HTMLFixer):
         "__fastcall": "m-special",
         "__cdecl": "m-special",
     }
+    # every modifier contains one of these; testing for them is much cheaper than running the full regex
+    _modifierKeywords = (
+        "defaulted",
+        "noexcept",
+        "constexpr",
+        "virtual",
+        "protected",
+        "__vectorcall",
+        "__stdcall",
+        "__fastcall",
+        "__cdecl",
+    )
+
+
+CPP_MODIFIERS_1 = re.compile(rf'(\s+)({_CPPModifiersBase._modifierRegex})(\s+)')
+CPP_MODIFIERS_2 = re.compile(rf'\s+({_CPPModifiersBase._modifierRegex})\s+')
 
 
 class CPPModifiers1(_CPPModifiersBase):
@@ -322,24 +357,35 @@ class CPPModifiers1(_CPPModifiersBase):
     Fixes improperly-parsed modifiers on function signatures in the various 'detail view' sections.
     '''
 
-    __expression = re.compile(rf'(\s+)({_CPPModifiersBase._modifierRegex})(\s+)')
+    required_text = ('m-doc-wrap',)
     __sections = ('pub-static-methods', 'pub-methods', 'friends', 'func-members')
-
-    @classmethod
-    def __substitute(cls, m, out):
-        return f'{m[1]}<span class="poxy-injected m-label m-flat {cls._modifierClasses[m[2]]}">{m[2]}</span>{m[3]}'
+    __label_classes = {
+        mod: ['poxy-injected', 'm-label', 'm-flat', cls] for mod, cls in _CPPModifiersBase._modifierClasses.items()
+    }
 
     def __call__(self, context: Context, doc: soup.HTMLDocument, path: Path):
         if doc.article_content is None:
             return False
         changed = False
         for sect in self.__sections:
-            tags = doc.find_all_from_sections('dt', select='span.m-doc-wrap', section=sect)
+            tags = doc.find_all_from_sections('dt', section=sect)
+            tags = [span for tag in tags for span in tag.find_all('span', class_='m-doc-wrap')]
             for tag in tags:
-                replacer = RegexReplacer(self.__expression, self.__substitute, str(tag))
-                if replacer:
-                    changed = True
-                    soup.replace_tag(tag, str(replacer))
+                # modifiers are only ever matched within a single run of text, so the labels can be spliced in
+                # around just the strings that contain one (rather than serializing and re-parsing the whole signature)
+                for string in soup.string_descendants(tag, lambda s: type(s) is NavigableString):
+                    if not any(k in string for k in self._modifierKeywords):
+                        continue
+                    text = str(string)
+                    pos = 0
+                    for m in CPP_MODIFIERS_1.finditer(text):
+                        string.insert_before(text[pos : m.start(2)])
+                        doc.new_tag('span', string=m[2], class_=list(self.__label_classes[m[2]]), before=string)
+                        pos = m.end(2)
+                    if pos:
+                        string.insert_before(text[pos:])
+                        string.extract()
+                        changed = True
         return changed
 
 
@@ -348,8 +394,6 @@ class CPPModifiers2(_CPPModifiersBase):
     Fixes improperly-parsed modifiers on function signatures in the 'Function documentation' section.
     '''
 
-    __expression = re.compile(rf'\s+({_CPPModifiersBase._modifierRegex})\s+')
-
     @classmethod
     def __substitute(cls, m, matches):
         matches.append(m[1])
@@ -369,24 +413,32 @@ class CPPModifiers2(_CPPModifiersBase):
             funcs = section(id=True)
             funcs = [f.find('h3') for f in funcs]
             for f in funcs:
-                bumper = f.select_one('span.m-doc-wrap-bumper')
-                end = f.select_one('span.m-doc-wrap').contents
+                bumper = f.find('span', class_='m-doc-wrap-bumper')
+                end = f.find('span', class_='m-doc-wrap').contents
                 end = end[len(end) - 1]
+                bumper_str = str(bumper)
+                if not any(k in bumper_str for k in self._modifierKeywords):
+                    continue
                 matches = []
-                bumperContent = self.__expression.sub(lambda m: self.__substitute(m, matches), str(bumper))
+                bumperContent = CPP_MODIFIERS_2.sub(lambda m: self.__substitute(m, matches), bumper_str)
                 if matches:
                     changed = True
                     soup.replace_tag(bumper, bumperContent)
-                    lastInserted = end.find('span')
-                    for match in matches:
-                        lastInserted = doc.new_tag(
-                            'span',
-                            parent=end,
-                            string=match,
-                            class_=f'poxy-injected m-label {self._modifierClasses[match]}',
-                            before=lastInserted,
+                    # labels go in front of the first span (or at the end), last match first
+                    labels = []
+                    for match in reversed(matches):
+                        labels.append(
+                            doc.new_tag(
+                                'span', string=match, class_=f'poxy-injected m-label {self._modifierClasses[match]}'
+                            )
                         )
-                        lastInserted.insert_after(' ')
+                        labels.append(' ')
+                    first_span = end.find('span')
+                    for label in labels:
+                        if first_span is not None:
+                            first_span.insert_before(label)
+                        else:
+                            end.append(label)
         return changed
 
 
@@ -395,6 +447,8 @@ class StripIncludes(HTMLFixer):
     Strips #include <paths/to/headers.h> based on context.sources.strip_includes.
     '''
 
+    required_text = ('m-doc-include',)
+
     def __call__(self, context: Context, doc: soup.HTMLDocument, path: Path):
         if doc.article is None or not context.sources.strip_includes:
             return False
@@ -436,10 +490,8 @@ class Banner(HTMLFixer):
             return False
 
         # ensure it's the first image in the page, before any subsections or headings
-        for sibling_tag in ('section', 'h2', 'h3', 'h4', 'h5', 'h6'):
-            sibling = banner.find_previous_sibling(sibling_tag)
-            if sibling is not None:
-                return False
+        if banner.find_previous_sibling(('section', 'h2', 'h3', 'h4', 'h5', 'h6')) is not None:
+            return False
 
         banner = banner.extract()
         h1.replace_with(banner)
@@ -473,46 +525,50 @@ class CodeBlocks(HTMLFixer):
     Fixes various issues and improves syntax highlighting in <code> blocks.
     '''
 
-    __keywords = (
-        r'alignas',
-        r'alignof',
-        r'bool',
-        r'char',
-        r'char16_t',
-        r'char32_t',
-        r'char8_t',
-        r'class',
-        r'const',
-        r'consteval',
-        r'constexpr',
-        r'constinit',
-        r'do',
-        r'double',
-        r'else',
-        r'explicit',
-        r'false',
-        r'float',
-        r'if',
-        r'inline',
-        r'int',
-        r'long',
-        r'mutable',
-        r'noexcept',
-        r'short',
-        r'signed',
-        r'sizeof',
-        r'struct',
-        r'template',
-        r'true',
-        r'typename',
-        r'unsigned',
-        r'void',
-        r'wchar_t',
-        r'while',
+    required_text = ('m-code', 'm-console')
+
+    __keywords = frozenset(
+        (
+            r'alignas',
+            r'alignof',
+            r'bool',
+            r'char',
+            r'char16_t',
+            r'char32_t',
+            r'char8_t',
+            r'class',
+            r'const',
+            r'consteval',
+            r'constexpr',
+            r'constinit',
+            r'do',
+            r'double',
+            r'else',
+            r'explicit',
+            r'false',
+            r'float',
+            r'if',
+            r'inline',
+            r'int',
+            r'long',
+            r'mutable',
+            r'noexcept',
+            r'short',
+            r'signed',
+            r'sizeof',
+            r'struct',
+            r'template',
+            r'true',
+            r'typename',
+            r'unsigned',
+            r'void',
+            r'wchar_t',
+            r'while',
+        )
     )
 
     __ns_token_expr = re.compile(r'(?:::|[a-zA-Z_][a-zA-Z_0-9]*|::[a-zA-Z_][a-zA-Z_0-9]*|[a-zA-Z_][a-zA-Z_0-9]*::)')
-    __ns_full_expr = re.compile(r'(?:::)?[a-zA-Z_][a-zA-Z_0-9]*(::[a-zA-Z_][a-zA-Z_0-9]*)*(?:::)?')
+    __ns_full_expr = re.compile(r'(?:::)?[a-zA-Z_][a-zA-Z_0-9]*(?:::[a-zA-Z_][a-zA-Z_0-9]*)*(?:::)?')
     __compound_starter_classes = (  # must not contain: fm, o, p, nc, mi, nf, nn
         r'n',
         r'no',
@@ -524,6 +580,9 @@ class CodeBlocks(HTMLFixer):
         r'nb',
     )
     __compound_classes = (*__compound_starter_classes, r'mi', r'nf', r'nc', r'nn')  # must not contain:  fm, o, p
+    __compound_starter_classes_set = frozenset(__compound_starter_classes)
+    __compound_classes_set = frozenset(__compound_classes)
+    __func_name_classes = frozenset((r'n', r'nc'))
     __func_name = re.compile(r'^\s*[a-zA-Z_][a-zA-Z0-9_]*\s*$')
     __func_bracket = re.compile(r'^\s*[(]')
 
@@ -582,11 +641,46 @@ class CodeBlocks(HTMLFixer):
     def __call__(self, context: Context, doc: soup.HTMLDocument, path: Path):
         changed = False
 
+        # hoisted out of the per-span loops below
+        is_macro = context.code_blocks.macros.fullmatch
+        is_ns_token = self.__ns_token_expr.fullmatch
+        is_ns_full = self.__ns_full_expr.fullmatch
+        is_func_name = self.__func_name.fullmatch
+        name_token_classes = frozenset((*self.__compound_classes, r'o', r'p'))
+
+        def spans_with_classes(spans, classes) -> list:
+            # equivalent to code_block('span', class_=classes, string=True) over an already-collected span list
+            results = []
+            for span in spans:
+                span_classes = span.attrs.get('class')
+                if not span_classes:
+                    continue
+                if isinstance(span_classes, str):
+                    span_classes = (span_classes,)
+                if not classes.isdisjoint(span_classes) and span.string is not None:
+                    results.append(span)
+            return results
+
+        def is_name_token(tag) -> bool:
+            # reads .string and the class list once per sibling step instead of going back through the tag each check
+            if tag is None or isinstance(tag, NavigableString):
+                return False
+            string = tag.string
+            if string is None:
+                return False
+            classes = tag.attrs.get('class')
+            if not classes:
+                return False
+            if isinstance(classes, str):
+                classes = (classes,)
+            return not name_token_classes.isdisjoint(classes) and is_ns_token(string) is not None
+
         # fix up syntax highlighting
+        # each block is fixed up independently of the others, so a block that came through a pass unchanged is
+        # already settled; only the ones that changed need to go around again
         code_blocks = doc.body(('pre', 'code'), class_='m-code')
-        changed_this_pass = True
-        while changed_this_pass:
-            changed_this_pass = False
+        while code_blocks:
+            changed_blocks = []
             for code_block in code_blocks:
                 changed_this_block = False
 
@@ -619,16 +713,19 @@ class CodeBlocks(HTMLFixer):
 
                     mlc_open = next_open
 
+                # one descendant scan per block; the stages below filter it against each span's current classes
+                all_spans = code_block(r'span')
+
                 # macros
-                spans = code_block(r'span', class_=self.__compound_classes, string=True)
+                spans = spans_with_classes(all_spans, self.__compound_classes_set)
                 for span in spans:
-                    if context.code_blocks.macros.fullmatch(span.get_text()):
+                    if is_macro(span.get_text()):
                         soup.set_class(span, r'fm')  # Name.Function.Magic
                         changed_this_block = True
 
                 if 1:
                     # collect all names and glom them all together as compound names
-                    spans = code_block(r'span', class_=self.__compound_starter_classes, string=True)
+                    spans = spans_with_classes(all_spans, self.__compound_starter_classes_set)
                     compound_names = []
                     compound_name_evaluated_tags = set()
                     for i in range(0, len(spans)):
@@ -637,55 +734,51 @@ class CodeBlocks(HTMLFixer):
                             continue
 
                         compound_name_evaluated_tags.add(id(current))
-                        tags = [current]
+                        tags = [current]  # collected right-to-left, then flipped
                         while True:
                             prev = current.previous_sibling
-                            if (
-                                prev is None
-                                or prev.string is None
-                                or isinstance(prev, NavigableString)
-                                or not soup.has_any_classes(prev, *self.__compound_classes, r'o', r'p')
-                                or not self.__ns_token_expr.fullmatch(prev.string)
-                            ):
+                            if not is_name_token(prev):
                                 break
                             current = prev
-                            tags.insert(0, current)
+                            tags.append(current)
                             compound_name_evaluated_tags.add(id(current))
+                        tags.reverse()
 
                         current = spans[i]
                         while True:
                             nxt = current.next_sibling
-                            if (
-                                nxt is None
-                                or nxt.string is None
-                                or isinstance(nxt, NavigableString)
-                                or not soup.has_any_classes(nxt, *self.__compound_classes, r'o', r'p')
-                                or not self.__ns_token_expr.fullmatch(nxt.string)
-                            ):
+                            if not is_name_token(nxt):
                                 break
                             current = nxt
                             tags.append(current)
                             compound_name_evaluated_tags.add(id(current))
 
                         full_str = ''.join([tag.get_text() for tag in tags])
-                        if self.__ns_full_expr.fullmatch(full_str):
-                            while tags and tags[0].string == '::':
-                                del tags[0]
-                            while tags and tags[-1].string == '::':
+                        if is_ns_full(full_str):
+                            first = 0
+                            while first < len(tags) and tags[first].string == '::':
+                                first += 1
+                            while len(tags) > first and tags[-1].string == '::':
                                 del tags[-1]
+                            if first:
+                                tags = tags[first:]
                             if tags:
                                 compound_names.append(tags)
 
                     # types, namespaces, enums, free functions
+                    compound_names_changed = False
                     for tags in compound_names:
                         if self.__colourize_compound_def(tags, context):
-                            changed_this_block = True
+                            compound_names_changed = True
+                    if compound_names_changed:
+                        changed_this_block = True
+                        all_spans = code_block(r'span')  # namespace tags may have been decomposed
 
                 # functions:
                 if 1:
-                    spans = code_block(r'span', class_=(r'n', r'nc'), string=True)
+                    spans = spans_with_classes(all_spans, self.__func_name_classes)
                     for func in spans:
-                        if not self.__func_name.fullmatch(func.string):
+                        if not is_func_name(func.string):
                             continue
                         bracket = func.next_sibling
                         if (
@@ -699,7 +792,7 @@ class CodeBlocks(HTMLFixer):
                         changed_this_block = True
 
                 # keywords
-                spans = code_block(r'span', class_=self.__compound_classes, string=True)
+                spans = spans_with_classes(all_spans, self.__compound_classes_set)
                 for span in spans:
                     if span.string in self.__keywords:
                         soup.set_class(span, r'k')  # Keyword
@@ -707,8 +800,9 @@ class CodeBlocks(HTMLFixer):
 
                 if changed_this_block:
                     code_block.smooth()
-                    changed_this_pass = True
-            changed = changed or changed_this_pass
+                    changed_blocks.append(code_block)
+                    changed = True
+            code_blocks = changed_blocks
 
         # fix doxygen butchering code blocks as inline nonsense
         code_blocks = doc.body('code', class_=('m-code', 'm-console'))
@@ -740,7 +834,7 @@ class AutoDocLinks(HTMLFixer):
     Adds links to additional sources where appropriate.
     '''
 
-    __allowedNames = ('dd', 'p', 'dt', 'h3', 'td', 'div', 'figcaption')
+    __allowedNames = frozenset(('dd', 'p', 'dt', 'h3', 'td', 'div', 'figcaption'))
 
     @classmethod
     def __substitute(cls, m, uri):
@@ -801,30 +895,31 @@ class AutoDocLinks(HTMLFixer):
             )
             strings = []
             for tag in tags:
-                strings = strings + soup.string_descendants(tag, lambda t: soup.find_parent(t, 'a', tag) is None)
+                strings.extend(soup.string_descendants(tag, prune='a'))
             strings = [s for s in strings if s.parent is not None]
+
+            # each string is escaped once and the escaped text is carried along with it through the per-pattern loop
+            candidates = [(s, html.escape(str(s), quote=False)) for s in strings]
+            if context.autolinks_regex is not None:
+                candidates = [c for c in candidates if context.autolinks_regex.search(c[1])]
             for expr, uri in context.autolinks:
                 if uri == path.name:  # don't create unnecessary self-links
                     continue
                 i = 0
-                while i < len(strings):
-                    string = strings[i]
-                    parent = string.parent
-                    replacer = RegexReplacer(
-                        expr, lambda m, out: self.__substitute(m, uri), html.escape(str(string), quote=False)
-                    )
-                    if replacer:
-                        repl_str = str(replacer)
+                while i < len(candidates):
+                    string, text = candidates[i]
+                    repl_str, count = expr.subn(lambda m: self.__substitute(m, uri), text)
+                    if count:
                         begins_with_ws = len(repl_str) > 0 and repl_str[:1].isspace()
                         new_tags = soup.replace_tag(string, repl_str)
                         if begins_with_ws and new_tags[0].string is not None and not new_tags[0].string[:1].isspace():
                             new_tags[0].insert_before(' ')
                         changed = True
-                        del strings[i]
+                        del candidates[i]
                         for tag in new_tags:
-                            strings = strings + soup.string_descendants(
-                                tag, lambda t: soup.find_parent(t, 'a', parent) is None
-                            )
+                            if tag.name != 'a':
+                                for s in soup.string_descendants(tag, prune='a'):
+                                    candidates.append((s, html.escape(str(s), quote=False)))
                         continue
                     i = i + 1
         return changed
@@ -842,13 +937,36 @@ class Links(HTMLFixer):
     __cppreference = re.compile(r'^\s*(?:https?[:]//)?(?:[a-z]+[.])?cppreference[.]com/.*$', re.I)
     __named_req = re.compile(r'^\s*(?:https?[:]//)?(?:[a-z]+[.])?cppreference[.]com/.+?/named_req/.+?$', re.I)
 
+    def __init__(self):
+        # the same local hrefs show up on almost every page (navbar etc.) and the set of output files doesn't change
+        # during post-processing, so the filesystem only needs to be asked about each one once
+        self.__local_files = dict()
+
+    def __local_file_exists(self, dir: str, name: str) -> bool:
+        file = os.path.join(dir, name)
+        exists = self.__local_files.get(file)
+        if exists is None:
+            exists = os.path.exists(file)
+            self.__local_files[file] = exists
+        return exists
+
     def __call__(self, context: Context, doc: soup.HTMLDocument, path: Path):
         changed = False
+        dir = str(path.parent)
 
-        elems_with_ids = [e for e in doc.body(id=True) if e['id'] is not None and len(e['id'])]
-        elems_with_ids = {e['id']: e for e in elems_with_ids}
+        # the id map and the anchor list both come out of one walk of the body rather than a find_all() each
+        elems_with_ids = dict()
+        anchors = []
+        for tag in doc.body.descendants:
+            if isinstance(tag, NavigableString):
+                continue
+            tag_id = tag.attrs.get('id')
+            if tag_id:
+                elems_with_ids[tag_id] = tag
+            if tag.name == 'a' and tag.attrs.get('href') is not None:
+                anchors.append(tag)
 
-        for anchor in doc.body('a', href=True):
+        for anchor in anchors:
             # make sure internal links to #ids on the same page don't get treated as external links
             # (some versions of doxygen did this with @ref)
             if anchor['href'].startswith(rf'{path.name}#'):
@@ -889,12 +1007,12 @@ class Links(HTMLFixer):
 
             # make sure links to local files point to actual existing files
             match = self.__local_href.fullmatch(anchor['href'])
-            if match and not coerce_path(path.parent, match[1]).exists():
+            if match and not self.__local_file_exists(dir, match[1]):
                 changed = True
                 # fix for some doxygen versions not emitting the 'md_' prefix:
                 if match[1].startswith(r'md_'):
                     repl_name = match[1][3:]
-                    if repl_name and coerce_path(path.parent, repl_name).exists():
+                    if repl_name and self.__local_file_exists(dir, repl_name):
                         anchor[r'href'] = repl_name
                         continue
                 # non-existent hrefs that correspond to internal documentation can sometimes by fixed by the next step
@@ -991,7 +1109,11 @@ class InjectSVGs(HTMLFixer):
         count = 0
         for img in imgs:
             src = Path(path.parent, img[r'src'])
-            if not src.exists() or not src.is_file() or src.stat().st_size > (1024 * 16):  # max 16 kb
+            try:
+                src_stat = src.stat()
+            except OSError:
+                continue
+            if not stat.S_ISREG(src_stat.st_mode) or src_stat.st_size > (1024 * 16):  # max 16 kb
                 continue
             svg = SVG(
                 src,  #
@@ -1009,11 +1131,18 @@ class RemoveTemplateNoise(HTMLFixer):
     Removes some template noise from detail blocks.
     '''
 
+    required_text = ('m-doc-details-prefix',)
+
+    __template_prefix = re.compile(r'([a-zA-Z_][a-zA-Z_0-9:]*)<.+?>::')
+
     def __call__(self, context: Context, doc: soup.HTMLDocument, path: Path):
         tags = [tag for tag in doc.article.find_all(r'span', class_='m-doc-details-prefix') if not tag.decomposed]
         changed = False
         for tag in tags:
-            m = re.fullmatch(r'([a-zA-Z_][a-zA-Z_0-9:]*)<.+?>::', tag.get_text())
+            text = tag.get_text()
+            if text.find('<') == -1:
+                continue
+            m = self.__template_prefix.fullmatch(text)
             if not m:
                 continue
             tag.string = rf'{m[1]}::'
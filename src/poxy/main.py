@@ -287,12 +287,13 @@ def multi_version_git_tags(args: argparse.Namespace):
     print("Linking versions in HTML output")
     tags = [t for t in tags if t in emitted_tags]
     html_root = args.output_dir.resolve() / 'html'
+    web_files = regex_glob(('*.css', '*.html', '*.js'))
     for tag in tags:
         html_dir = html_root
         if tag != default_branch:
             html_dir /= tag
         assert_existing_directory(html_dir)
-        for fp in get_all_files(html_dir, any=('*.css', '*.html', '*.js'), recursive=False):
+        for fp in scan_files(html_dir, any=web_files):
             text = read_all_text_from_file(fp)
             if tag != default_branch:
                 text = text.replace('href="poxy/', 'href="../poxy/')
@@ -1569,11 +1569,7 @@ class Context(object):
                                 candidate_names, candidate_extensions, as_lowercase
                             ):
                                 candidate_file = Path(candidate_dir, rf'{name.lower() if lower else name}{ext}')
-                                if (
-                                    candidate_file.exists()
-                                    and candidate_file.is_file()
-                                    and candidate_file.stat().st_size <= 1024 * 1024 * 2
-                                ):
+                                if candidate_file.is_file() and candidate_file.stat().st_size <= 1024 * 1024 * 2:
                                     self.changelog = candidate_file
                                     break
                             if (
@@ -1592,7 +1588,7 @@ class Context(object):
                     self.changelog = coerce_path(config['changelog'])
                     if not self.changelog.is_absolute():
                         self.changelog = Path(self.input_dir, self.changelog)
-                    if not self.changelog.exists() or not self.changelog.is_file():
+                    if not self.changelog.is_file():
                         raise Error(rf'changelog: {config["changelog"]} did not exist or was not a file')
             if self.changelog:
                 temp_changelog_path = Path(self.temp_pages_dir, r'poxy_changelog.md')
@@ -1614,11 +1610,7 @@ class Context(object):
                                 candidate_names, candidate_extensions, as_lowercase
                             ):
                                 candidate_file = Path(candidate_dir, rf'{name.lower() if lower else name}{ext}')
-                                if (
-                                    candidate_file.exists()
-                                    and candidate_file.is_file()
-                                    and candidate_file.stat().st_size <= 1024 * 1024 * 2
-                                ):
+                                if candidate_file.is_file() and candidate_file.stat().st_size <= 1024 * 1024 * 2:
                                     self.main_page = candidate_file
                                     break
                             if (
@@ -1637,7 +1629,7 @@ class Context(object):
                     self.main_page = coerce_path(config['main_page'])
                     if not self.main_page.is_absolute():
                         self.main_page = Path(self.input_dir, self.main_page)
-                    if not self.main_page.exists() or not self.main_page.is_file():
+                    if not self.main_page.is_file():
                         raise Error(rf'main_page: {config["main_page"]} did not exist or was not a file')
             self.verbose_value(r'Context.main_page', self.main_page)
 
@@ -1861,7 +1853,7 @@ class Context(object):
                     extra_files.append(self.favicon)
             else:
                 favicon = Path(self.input_dir, 'favicon.ico')
-                if favicon.exists() and favicon.is_file():
+                if favicon.is_file():
                     self.favicon = favicon
                     extra_files.append(favicon)
             self.verbose_value(r'Context.favicon', self.favicon)
@@ -1959,7 +1951,7 @@ class Context(object):
                     file = (coerce_path(file[0]), file[1])
                 if not file[0].is_absolute():
                     file = (Path(self.input_dir, file[0]).resolve(), file[1])
-                if not file[0].exists() or not file[0].is_file():
+                if not file[0].is_file():
                     raise Error(rf'extra_files: {file[0]} did not exist or was not a file')
                 if file[1] in self.extra_files:
                     raise Error(rf'extra_files: Multiple files with the name {file[1]}')
@@ -15,6 +15,7 @@ import copy
 import sys
 
 from io import StringIO
+from xml.sax.saxutils import escape as xml_escape
 from lxml import etree
 from trieregex import TrieRegEx
 
@@ -27,13 +28,30 @@ from .version import *
 if sys.version_info >= (3, 8):
     import shutil
 
-    def copy_tree(src, dest):
-        shutil.copytree(str(src), str(dest), dirs_exist_ok=True)
+    def copy_tree(src, dest, threads=1):
+        # plain copyfile() rather than the default copy2(): it still takes the sendfile/fcopyfile fast paths,
+        # but skips the per-file copystat() (chmod, utime, xattrs) that nothing downstream cares about
+        if threads <= 1:
+            shutil.copytree(str(src), str(dest), dirs_exist_ok=True, copy_function=shutil.copyfile)
+            return
+
+        # copytree() still walks the source and creates the directories, but the file copies themselves
+        # are handed off to a pool (they're independent, and the copy syscalls release the GIL)
+        with futures.ThreadPoolExecutor(max_workers=threads) as executor:
+            copies = []
+            shutil.copytree(
+                str(src),
+                str(dest),
+                dirs_exist_ok=True,
+                copy_function=lambda s, d: copies.append(executor.submit(shutil.copyfile, s, d)),
+            )
+            for copy in copies:
+                copy.result()
 
 else:
     import distutils.dir_util
 
-    def copy_tree(src, dest):
+    def copy_tree(src, dest, threads=1):
         distutils.dir_util.copy_tree(str(src), str(dest))
 
 
@@ -307,11 +325,23 @@ def preprocess_tagfiles(context: Context):
                 f.write(text)
 
 
+def _relink_implementation_headers(xml_file: Path, context: Context, relinks: typing.Dict[str, str], relinks_regex):
+    xml_text = read_all_text_from_file(xml_file, logger=context.verbose_logger)
+    new_xml_text = relinks_regex.sub(lambda m: relinks[m[0]], xml_text)
+    if new_xml_text == xml_text:
+        return
+    context.verbose(rf"Re-linking implementation headers in '{xml_file}'")
+    # only attribute values and text were substituted (with escaped replacements) so the result is still well-formed
+    # and can be written back as-is, without a parse + serialize round-trip
+    with open(xml_file, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(new_xml_text)
+
+
 def postprocess_xml(context: Context):
     assert context is not None
     assert isinstance(context, Context)
 
-    xml_files = [f for f in get_all_files(context.temp_xml_dir, any=(r'*.xml')) if f.name.lower() != r'doxyfile.xml']
+    xml_files = [f for f in scan_files(context.temp_xml_dir, any=r'*.xml') if f.name.lower() != r'doxyfile.xml']
     if not xml_files:
         return
 
@@ -413,14 +443,14 @@ def postprocess_xml(context: Context):
             # 'file' entries for markdown and dox files
             dox_files = [rf'*{doxygen.mangle_name(ext)}.xml' for ext in (r'.dox', r'.md')]
             dox_files.append(r'md_home.xml')
-            for xml_file in get_all_files(context.temp_xml_dir, any=dox_files):
+            for xml_file in scan_files(context.temp_xml_dir, any=dox_files):
                 delete_file(xml_file, logger=context.verbose_logger)
 
             # 'dir' entries for empty directories
             deleted = True
             while deleted:
                 deleted = False
-                for xml_file in get_all_files(context.temp_xml_dir, all=(r'dir*.xml')):
+                for xml_file in scan_files(context.temp_xml_dir, any=r'dir*.xml'):
                     root = xml_utils.read(xml_file)
                     compounddef = root.find(r'compounddef')
                     if compounddef is None or compounddef.get(r'kind') != r'dir':
@@ -436,16 +466,15 @@ def postprocess_xml(context: Context):
                         deleted = True
 
         extracted_implementation = False
-        xml_files = [
-            f for f in get_all_files(context.temp_xml_dir, any=(r'*.xml')) if f.name.lower() != r'doxyfile.xml'
-        ]
+        xml_files = [f for f in scan_files(context.temp_xml_dir, any=r'*.xml') if f.name.lower() != r'doxyfile.xml']
         all_inners_by_type = {r'namespace': set(), r'class': set(), r'concept': set()}
 
         # do '<doxygenindex>' first
+        # (only the root tag is needed to find it, so the other files don't need to be parsed in full here)
         for xml_file in xml_files:
-            root = xml_utils.read(xml_file)
-            if root.tag != r'doxygenindex':
+            if xml_utils.read_root_tag(xml_file) != r'doxygenindex':
                 continue
+            root = xml_utils.read(xml_file)
 
             context.verbose(rf'Post-processing {xml_file}')
             changed = False
@@ -659,20 +688,22 @@ def postprocess_xml(context: Context):
                 # per-section stuff
                 for section in compounddef.findall(r'sectiondef'):
                     # remove members which are listed multiple times because doxygen is idiotic:
-                    members = [tag for tag in section.findall(r'memberdef')]
-                    for i in range(len(members) - 1, 0, -1):
-                        for j in range(i):
-                            if members[i].get(r'id') == members[j].get(r'id'):
-                                section.remove(members[i])
-                                changed = True
-                                break
+                    # (the first of each is kept, and the survivors are reused below; nothing else adds or removes any)
+                    section_members = []
+                    seen_ids = set()
+                    for tag in section.findall(r'memberdef'):
+                        member_id = tag.get(r'id')
+                        if member_id in seen_ids:
+                            section.remove(tag)
+                            changed = True
+                            continue
+                        seen_ids.add(member_id)
+                        section_members.append(tag)
 
                     # fix keywords like 'friend' erroneously included in the type
                     if 1:
                         members = [
-                            m
-                            for m in section.findall(r'memberdef')
-                            if m.get(r'kind') in (r'friend', r'function', r'variable')
+                            m for m in section_members if m.get(r'kind') in (r'friend', r'function', r'variable')
                         ]
 
                         # leaked keywords
@@ -714,9 +745,7 @@ def postprocess_xml(context: Context):
 
                     # fix issues with trailing return types
                     if 1:
-                        members = [
-                            m for m in section.findall(r'memberdef') if m.get(r'kind') in (r'friend', r'function')
-                        ]
+                        members = [m for m in section_members if m.get(r'kind') in (r'friend', r'function')]
 
                         for member in members:
                             type_elem = member.find(r'type')
@@ -753,7 +782,7 @@ def postprocess_xml(context: Context):
                                 return ''
                             return '' if n.text is None else n.text
 
-                        members = [tag for tag in section.findall(r'memberdef')]
+                        members = section_members
                         for tag in members:
                             section.remove(tag)
                         # fmt: off
@@ -773,10 +802,11 @@ def postprocess_xml(context: Context):
                             if sort:
                                 group.sort(key=sort_members_by_name)
                             for tag in group:
-                                members.remove(tag)
                                 section.append(tag)
                                 changed = True
                         # if we've missed any groups just glob them on the end
+                        grouped = set(tag for group, _ in groups for tag in group)
+                        members = [tag for tag in members if tag not in grouped]
                         if members:
                             members.sort(key=sort_members_by_name)
                             changed = True
@@ -974,16 +1004,27 @@ def postprocess_xml(context: Context):
 
     # scan through the files and substitute impl header ids and paths as appropriate
     if 1 and context.implementation_headers:
-        xml_files = get_all_files(context.temp_xml_dir, any=('*.xml'))
-        for xml_file in xml_files:
-            context.verbose(rf"Re-linking implementation headers in '{xml_file}'")
-            xml_text = read_all_text_from_file(xml_file, logger=context.verbose_logger)
-            for hp, hfn, hid, impl in implementation_header_data:
-                for ip, ifn, iid in impl:
-                    # xml_text = xml_text.replace(f'refid="{iid}"',f'refid="{hid}"')
-                    xml_text = xml_text.replace(rf'compoundref="{iid}"', f'compoundref="{hid}"')
-                    xml_text = xml_text.replace(ip, hp)
-            xml_utils.write(xml_text, xml_file)
+        # all the (old -> new) substitutions as a single alternation so each file is only scanned once
+        relinks = dict()
+        for hp, hfn, hid, impl in implementation_header_data:
+            for ip, ifn, iid in impl:
+                # relinks.setdefault(f'refid="{iid}"', f'refid="{hid}"')
+                relinks.setdefault(rf'compoundref="{iid}"', f'compoundref="{hid}"')
+                relinks.setdefault(ip, xml_escape(hp, {'"': '&quot;'}))
+        relinks_regex = re.compile(r'|'.join([re.escape(k) for k in sorted(relinks, key=lambda k: (-len(k), k))]))
+
+        xml_files = scan_files(context.temp_xml_dir, any=r'*.xml')
+        threads = min(len(xml_files), context.threads, 16)
+        if threads > 1:
+            # files are independent here, and the file I/O releases the GIL
+            with futures.ThreadPoolExecutor(max_workers=threads) as executor:
+                for _ in executor.map(
+                    lambda f: _relink_implementation_headers(f, context, relinks, relinks_regex), xml_files
+                ):
+                    pass
+        else:
+            for xml_file in xml_files:
+                _relink_implementation_headers(xml_file, context, relinks, relinks_regex)
 
 
 def postprocess_xml_v2(context: Context):
@@ -1007,7 +1048,7 @@ def postprocess_xml_v2(context: Context):
     # - sort user-defined sections based on their name
     # - implementation headers
 
-    for f in enumerate_files(context.temp_xml_dir, any=r'*.xml'):
+    for f in scan_files(context.temp_xml_dir, any=r'*.xml'):
         delete_file(f, logger=log_func)
     doxygen.write_graph_to_xml(g, context.temp_xml_dir, log_func=log_func)
 
@@ -1016,7 +1057,7 @@ def parse_xml(context: Context):
     assert context is not None
     assert isinstance(context, Context)
 
-    xml_files = get_all_files(context.temp_xml_dir, any=(r'*.xml'))
+    xml_files = scan_files(context.temp_xml_dir, any=r'*.xml')
     xml_files += [coerce_path(f) for _, (f, _) in context.tagfiles.items()]
     if context.generate_tagfile and context.tagfile_path:
         xml_files.append(context.tagfile_path)
@@ -1118,7 +1159,7 @@ def parse_xml(context: Context):
                     tries.enum_values.add(rf'{enum_qualified_name}::{member_name.text}')
 
     for xml_file in xml_files:
-        if xml_file.name == r'Doxyfile.xml' or not xml_file.exists() or not xml_file.is_file():
+        if xml_file.name == r'Doxyfile.xml' or not xml_file.is_file():
             continue
 
         root = xml_utils.read(xml_file)
@@ -1197,7 +1238,7 @@ def clean_xml(context: Context, dir=None):
     if dir is None:
         dir = context.temp_xml_dir
 
-    xml_files = get_all_files(dir, any=(r'*.xml'))
+    xml_files = scan_files(dir, any=r'*.xml')
     for xml_file in xml_files:
         root = xml_utils.read(
             xml_file, parser=xml_utils.create_parser(remove_blank_text=True), logger=context.verbose_logger  #
@@ -1253,6 +1294,18 @@ def compile_regexes(context: Context):
     context.autolinks = tuple(
         [(re.compile(r'(?<![a-zA-Z_])' + expr + r'(?![a-zA-Z_])'), uri) for expr, uri in context.autolinks]
     )
+    # all autolinks as a single alternation so text that none of them can match is rejected with one scan.
+    # a pattern that refers back to one of its groups by number can't be joined with the others (the numbers shift),
+    # and clashing group names make the joined pattern fail to compile; either way every string is left to the
+    # per-pattern regexes
+    context.autolinks_regex = None
+    if context.autolinks and not any(
+        [expr.groups and re.search(r'\\[1-9]|[(][?][(][0-9]', expr.pattern) for expr, _ in context.autolinks]
+    ):
+        try:
+            context.autolinks_regex = re.compile(r'|'.join([rf'(?:{expr.pattern})' for expr, _ in context.autolinks]))
+        except re.error:
+            pass
 
 
 def preprocess_mcss_config(context: Context):
@@ -1520,22 +1573,28 @@ def postprocess_html_file(path, context: Context = None):
     context.info(rf'Post-processing {path}')
     text = None
     html = None
+    html_needs_smoothing = False
+    html_changed = False  # text goes stale once an html fixer has changed the document parsed from it
 
     def switch_to_html():
         nonlocal context
         nonlocal text
         nonlocal html
+        nonlocal html_changed
         if html is not None:
             return
         html = soup.HTMLDocument(text, logger=context.verbose_logger)
+        html_changed = False
 
     def switch_to_text():
         nonlocal context
         nonlocal text
         nonlocal html
+        nonlocal html_needs_smoothing
         if html is None:
             return
         html.smooth()
+        html_needs_smoothing = False
         text = str(html)
         html = None
 
@@ -1545,10 +1604,19 @@ def postprocess_html_file(path, context: Context = None):
 
         for fix in context.fixers:
             if isinstance(fix, fixers.HTMLFixer):
+                # while text still matches the document it can rule out fixers that would find nothing to do
+                if fix.required_text and (html is None or not html_changed):
+                    if not any(t in text for t in fix.required_text):
+                        continue
                 switch_to_html()
+                # deferred until another html fixer actually needs it; switch_to_text() always smooths anyway
+                if html_needs_smoothing:
+                    html.smooth()
+                    html_needs_smoothing = False
                 if fix(context, html, path):
                     changed = True
-                    html.smooth()
+                    html_needs_smoothing = True
+                    html_changed = True
             elif isinstance(fix, fixers.PlainTextFixer):
                 switch_to_text()
                 new_text = fix(context, text, path)
@@ -1559,8 +1627,10 @@ def postprocess_html_file(path, context: Context = None):
         if changed:
             switch_to_text()
             context.verbose(rf'Writing {path}')
-            with open(path, 'w', encoding='utf-8', newline='\n') as f:
-                f.write(text)
+            # encoded in one go rather than pushed through a text-mode wrapper
+            # (newline='\n' never translated anything on write, so the output is byte-identical)
+            with open(path, 'wb') as f:
+                f.write(text.encode('utf-8'))
 
     except Exception as e:
         context.info(rf'{type(e).__name__} raised while post-processing {path}')
@@ -1575,7 +1645,7 @@ def postprocess_html(context: Context):
     assert isinstance(context, Context)
 
     files = filter_filenames(
-        get_all_files(context.html_dir, any=('*.html', '*.htm')), context.html_include, context.html_exclude
+        scan_files(context.html_dir, any=('*.html', '*.htm')), context.html_include, context.html_exclude
     )
     if not files:
         return
@@ -1588,16 +1658,17 @@ def postprocess_html(context: Context):
         with futures.ProcessPoolExecutor(
             max_workers=threads, initializer=_initialize_worker, initargs=(context,)
         ) as executor:
-            jobs = [executor.submit(postprocess_html_file, file) for file in files]
-            for future in futures.as_completed(jobs):
+            # batch files into chunks so each worker round-trip does a meaningful amount of work
+            chunksize = max(1, min(16, len(files) // (threads * 4)))
+            try:
+                for _ in executor.map(postprocess_html_file, files, chunksize=chunksize):
+                    pass
+            except:
                 try:
-                    future.result()
-                except:
-                    try:
-                        executor.shutdown(wait=False, cancel_futures=True)
-                    except TypeError:
-                        executor.shutdown(wait=False)
-                    raise
+                    executor.shutdown(wait=False, cancel_futures=True)
+                except TypeError:
+                    executor.shutdown(wait=False)
+                raise
 
     else:
         for file in files:
@@ -1796,7 +1867,7 @@ def run(
             delete_directory(context.temp_original_xml_dir)
             run_doxygen(context)
             if keep_original_xml:
-                copy_tree(context.temp_xml_dir, context.temp_original_xml_dir)
+                copy_tree(context.temp_xml_dir, context.temp_original_xml_dir, threads=min(context.threads, 16))
                 clean_xml(context, dir=context.temp_original_xml_dir)
         with timer(r'Post-processing XML files') as t:
             if context.xml_v2:
@@ -1812,7 +1883,7 @@ def run(
         # XML (the user-requested copy)
         if context.output_xml:
             with ScopeTimer(r'Copying XML', print_start=True, print_end=context.verbose_logger) as t:
-                copy_tree(context.temp_xml_dir, context.xml_dir)
+                copy_tree(context.temp_xml_dir, context.xml_dir, threads=min(context.threads, 16))
 
             # copy tagfile
             if context.generate_tagfile and context.tagfile_path:
@@ -18,9 +18,17 @@ from .utils import *
 # =======================================================================================================================
 
 
+def _tag_names(names):
+    # normalizes a tag name or collection of names into something with cheap membership tests
+    if isinstance(names, (set, frozenset)):
+        return names
+    if is_collection(names):
+        return frozenset(names)
+    return (names,)
+
+
 def find_parent(tag, names, cutoff=None):
-    if not is_collection(names):
-        names = (names,)
+    names = _tag_names(names)
     parent = tag.parent
     while parent is not None:
         if cutoff is not None and parent is cutoff:
@@ -59,37 +67,48 @@ def shallow_search(starting_tag, names, filter=None):
     if isinstance(starting_tag, bs4.NavigableString):
         return []
 
-    if not is_collection(names):
-        names = (names,)
+    names = _tag_names(names)
 
     if starting_tag.name in names:
         if filter is None or filter(starting_tag):
             return [starting_tag]
 
+    # depth-first, in document order (children are pushed in reverse)
     results = []
-    for tag in starting_tag.children:
+    stack = list(reversed(starting_tag.contents))
+    while stack:
+        tag = stack.pop()
         if isinstance(tag, bs4.NavigableString):
             continue
         if tag.name in names:
             if filter is None or filter(tag):
                 results.append(tag)
         else:
-            results = results + shallow_search(tag, names, filter)
+            stack.extend(reversed(tag.contents))
     return results
 
 
-def string_descendants(starting_tag, filter=None):
+def string_descendants(starting_tag, filter=None, prune=None):
     if isinstance(starting_tag, bs4.NavigableString):
         if filter is None or filter(starting_tag):
             return [starting_tag]
+        return []
 
+    # strings inside descendant tags named in prune are skipped wholesale
+    # (cheaper than a filter that walks each string's parents looking for one)
+    if prune is not None:
+        prune = _tag_names(prune)
+
+    # depth-first, in document order (children are pushed in reverse)
     results = []
-    for tag in starting_tag.children:
+    stack = list(reversed(starting_tag.contents))
+    while stack:
+        tag = stack.pop()
         if isinstance(tag, bs4.NavigableString):
             if filter is None or filter(tag):
                 results.append(tag)
-        else:
-            results = results + string_descendants(tag, filter)
+        elif prune is None or tag.name not in prune:
+            stack.extend(reversed(tag.contents))
     return results
 
 
@@ -179,6 +198,7 @@ class HTMLDocument(object):
 
         self.table_of_contents = None
         self.sections = None
+        self.__id_sections = None
         if self.article_content is not None:
             for toc_tag in ('nav', 'div'):
                 for tag in self.article_content(toc_tag, class_='m-block m-default', recursive=False):
@@ -226,7 +246,9 @@ class HTMLDocument(object):
         if self.article_content is not None:
             sections = None
             if section is not None:
-                sections = self.article_content('section', recursive=False, id='section')
+                if self.__id_sections is None:  # fixers don't add or remove sections so this is stable
+                    self.__id_sections = self.article_content('section', recursive=False, id='section')
+                sections = self.__id_sections
             else:
                 sections = self.sections
             if include_toc and self.table_of_contents is not None:
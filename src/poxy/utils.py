@@ -7,8 +7,10 @@
 Low-level helper functions and useful bits.
 """
 
+import fnmatch
 import io
 import logging
+import os
 import re
 import sys
 import typing  # used transitively
@@ -42,6 +44,27 @@ def regex_or(patterns, pattern_prefix='', pattern_suffix='', flags=0):
     return patterns
 
 
+def regex_glob(globs):
+    # all the globs as a single pattern so a file listing only needs to be filtered once
+    # (case-insensitive only on windows, matching fnmatch's use of os.path.normcase)
+    globs = [str(g) for g in coerce_collection(globs) if g is not None and g]
+    assert globs
+    return re.compile(r'|'.join([rf'(?:{fnmatch.translate(g)})' for g in globs]), flags=re.I if os.name == 'nt' else 0)
+
+
+def scan_files(dir, any=None) -> typing.List[Path]:
+    # non-recursive get_all_files() built on os.scandir(), which gets file types from the directory listing itself
+    # rather than needing a stat() per entry
+    dir = coerce_path(dir)
+    assert_existing_directory(dir)
+    if any is not None and not isinstance(any, re.Pattern):
+        any = regex_glob(any)
+    with os.scandir(str(dir)) as entries:
+        files = [e.name for e in entries if (any is None or any.match(e.name)) and e.is_file()]
+    files.sort()
+    return [Path(dir, f) for f in files]
+
+
 def log(logger, msg, level=logging.INFO):
     if logger is None or msg is None:
         return
@@ -80,11 +103,23 @@ def filter_filenames(files, include, exclude):
 
 DOWNLOAD_HEADERS = {r'User-Agent': r'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:104.0) Gecko/20100101 Firefox/104.0'}
 
+_download_session = None
+
+
+def _get_download_session() -> requests.Session:
+    # shared so consecutive downloads from the same host (css imports, font files) reuse pooled connections
+    global _download_session
+    if _download_session is None:
+        _download_session = requests.Session()
+    return _download_session
+
 
 def download_text(uri: str, timeout=10, encoding='utf-8') -> str:
     assert uri is not None
     global DOWNLOAD_HEADERS
-    response = requests.get(str(uri), headers=DOWNLOAD_HEADERS, timeout=timeout, stream=False, allow_redirects=True)
+    response = _get_download_session().get(
+        str(uri), headers=DOWNLOAD_HEADERS, timeout=timeout, stream=False, allow_redirects=True
+    )
     if encoding is not None:
         response.encoding = encoding
     return response.text
@@ -93,7 +128,9 @@ def download_text(uri: str, timeout=10, encoding='utf-8') -> str:
 def download_binary(uri: str, timeout=10) -> bytes:
     assert uri is not None
     global DOWNLOAD_HEADERS
-    response = requests.get(str(uri), headers=DOWNLOAD_HEADERS, timeout=timeout, stream=False, allow_redirects=True)
+    response = _get_download_session().get(
+        str(uri), headers=DOWNLOAD_HEADERS, timeout=timeout, stream=False, allow_redirects=True
+    )
     return response.content
 
 
@@ -125,35 +162,6 @@ def temp_dir_name_for(input, path=None):
     return out
 
 
-# =======================================================================================================================
-# REGEX REPLACER
-# =======================================================================================================================
-
-
-class RegexReplacer(object):
-    def __substitute(self, m):
-        self.__result = True
-        return self.__handler(m, self.__out_data)
-
-    def __init__(self, regex, handler, value):
-        self.__handler = handler
-        self.__result = False
-        self.__out_data = []
-        self.__value = regex.sub(lambda m: self.__substitute(m), value)
-
-    def __str__(self):
-        return self.__value
-
-    def __bool__(self):
-        return self.__result
-
-    def __len__(self):
-        return len(self.__out_data)
-
-    def __getitem__(self, index):
-        return self.__out_data[index]
-
-
 # =======================================================================================================================
 # Custom exceptions
 # =======================================================================================================================
@@ -51,6 +51,21 @@ def read(source: Union[str, bytes, Path], parser=None, logger=None):
     return etree.fromstring(source, parser=parser)
 
 
+def read_root_tag(source: Path) -> str:
+    # the name of the root element, without parsing (or even reading) the rest of the document
+    assert source is not None
+    parser = etree.XMLPullParser(events=(r'start',), recover=True)
+    with open(str(source), 'rb') as f:
+        while True:
+            chunk = f.read(1024)
+            if not chunk:
+                break
+            parser.feed(chunk)
+            for _, elem in parser.read_events():
+                return elem.tag
+    return None
+
+
 ElementTypes = Union[etree.ElementBase, etree._Element, etree._ElementTree]
 
 
@@ -75,4 +90,4 @@ def write(
     tree.write(str(dest), encoding=r'utf-8', xml_declaration=xml_declaration, pretty_print=pretty_print)  #
 
 
-__all__ = ['create_parser', 'DEFAULT_PARSER', 'make_child', 'read', 'ElementTypes', 'write']
+__all__ = ['create_parser', 'DEFAULT_PARSER', 'make_child', 'read', 'read_root_tag', 'ElementTypes', 'write']